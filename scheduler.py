@@ -0,0 +1,166 @@
+import os
+from functools import lru_cache
+
+import streamlit as st
+from ortools.sat import sat_parameters_pb2
+from ortools.sat.python import cp_model
+
+# 🔧 Time helpers
+@lru_cache(maxsize=1024)
+def time_to_minutes(t):
+    h, m = t.split(":")
+    return int(h) * 60 + int(m)
+
+@lru_cache(maxsize=1024)
+def minutes_to_time(m):
+    return f"{m // 60:02d}:{m % 60:02d}"
+
+def define_available_slots(slots):
+    return [(time_to_minutes(start), time_to_minutes(end)) for start, end in slots]
+
+
+# 🧠 Smart Task Scheduler
+# Sessions run in separate threads, so each solve gets its own CpSolver built from these presets
+SOLVER_PARAMETERS = sat_parameters_pb2.SatParameters()
+SOLVER_PARAMETERS.max_time_in_seconds = 5.0
+SOLVER_PARAMETERS.num_workers = min(8, os.cpu_count() or 1)
+SOLVER_PARAMETERS.relative_gap_limit = 0.05
+
+# Up to this many tasks, a greedy packing is tried before building a CP-SAT model
+GREEDY_TASK_LIMIT = 5
+# Up to this many tasks, the first solution of a single worker is accepted as-is
+FIRST_SOLUTION_TASK_LIMIT = 20
+
+
+class _SolutionLimit(cp_model.CpSolverSolutionCallback):
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+        self.count = 0
+
+    def on_solution_callback(self):
+        self.count += 1
+        if self.count >= self.limit:
+            self.StopSearch()
+
+
+def _merge_slots(available_slots):
+    merged = []
+    for start, end in sorted(available_slots):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _insert_breaks(schedule, break_duration):
+    final_schedule = [schedule[0]]
+    for (_, _, end), task in zip(schedule, schedule[1:]):
+        final_schedule.append(("Break", end, end + break_duration))
+        final_schedule.append(task)
+    return final_schedule
+
+
+def _greedy(tasks, slots, break_duration):
+    # Place tasks by priority at the earliest free offset of the first slot that fits them
+    cursors = [start for start, _ in slots]
+    schedule = []
+    for name, duration, _ in sorted(tasks, key=lambda t: t[2]):
+        for s, (_, slot_end) in enumerate(slots):
+            start = cursors[s]
+            # Keep a full break from tasks already placed in neighbouring slots
+            for _, placed_start, placed_end in schedule:
+                if start < placed_end + break_duration and placed_start < start + duration + break_duration:
+                    start = placed_end + break_duration
+            if start + duration <= slot_end:
+                schedule.append((name, start, start + duration))
+                schedule.sort(key=lambda x: x[1])
+                cursors[s] = start + duration + break_duration
+                break
+        else:
+            return None
+    return schedule
+
+
+@st.cache_resource(ttl=3600, max_entries=32)
+def _build_model(tasks, available_slots, break_duration):
+    model = cp_model.CpModel()
+    task_vars = {}
+    # Overlapping or touching slots are merged so a task can use the whole contiguous window
+    slots = _merge_slots(available_slots)
+    padded_intervals = []
+
+    for task in tasks:
+        name, duration = task
+        fitting = [s for s, (start, end) in enumerate(slots) if end - start >= duration]
+        # A task may only start where it also finishes inside the same slot
+        start_domain = cp_model.Domain.FromIntervals([[slots[s][0], slots[s][1] - duration] for s in fitting])
+        end_domain = cp_model.Domain.FromIntervals([[slots[s][0] + duration, slots[s][1]] for s in fitting])
+        start_var = model.NewIntVarFromDomain(start_domain, f"start_{name}")
+        end_var = model.NewIntVarFromDomain(end_domain, f"end_{name}")
+        model.Add(end_var == start_var + duration)
+        # Pad each interval with the break so no-overlap also enforces spacing, across slots too
+        padded_intervals.append(model.NewFixedSizeIntervalVar(start_var, duration + break_duration, f"interval_{name}"))
+        task_vars[name] = (start_var, end_var)
+
+    model.AddNoOverlap(padded_intervals)
+    horizon = slots[-1][1] if slots else 0
+    return model, task_vars, horizon
+
+
+def _specialize_model(tasks, available_slots, break_duration):
+    # The cached skeleton only depends on names and durations; priorities are applied to a copy
+    skeleton, skeleton_vars, horizon = _build_model(
+        tuple((name, duration) for name, duration, _ in tasks), tuple(available_slots), break_duration
+    )
+    model = skeleton.Clone()
+    task_vars = {
+        name: (model.GetIntVarFromProtoIndex(start_var.Index()), model.GetIntVarFromProtoIndex(end_var.Index()))
+        for name, (start_var, end_var) in skeleton_vars.items()
+    }
+
+    # Hint the search to decide start times in priority order so important tasks are placed first
+    tasks = sorted(tasks, key=lambda t: t[2])
+    starts = [task_vars[name][0] for name, _, _ in tasks]
+    model.AddDecisionStrategy(starts, cp_model.CHOOSE_FIRST, cp_model.SELECT_MIN_VALUE)
+
+    # Start important tasks early (priority 1 is the highest, so invert it into a weight)
+    max_priority = max(priority for _, _, priority in tasks)
+    weights = [max_priority + 1 - priority for _, _, priority in tasks]
+    model.Maximize(horizon * sum(weights) - cp_model.LinearExpr.WeightedSum(starts, weights))
+    return model, task_vars
+
+
+def schedule_tasks(tasks, available_slots, break_duration=10):
+    if not tasks:
+        return []
+
+    if len(tasks) <= GREEDY_TASK_LIMIT:
+        slots = _merge_slots(available_slots)
+        needed = sum(duration for _, duration, _ in tasks) + (len(tasks) - 1) * break_duration
+        if needed <= sum(end - start for start, end in slots):
+            schedule = _greedy(tasks, slots, break_duration)
+            if schedule is not None:
+                return _insert_breaks(schedule, break_duration)
+
+    model, task_vars = _specialize_model(tasks, available_slots, break_duration)
+    solver = cp_model.CpSolver()
+    solver.parameters.CopyFrom(SOLVER_PARAMETERS)
+    if len(tasks) <= FIRST_SOLUTION_TASK_LIMIT:
+        # The decision strategy is only a hint under automatic search, so infeasibility is still proven quickly
+        solver.parameters.num_workers = 1
+        status = solver.Solve(model, _SolutionLimit(1))
+    else:
+        status = solver.Solve(model)
+
+    if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+        schedule = sorted(
+            ((name, solver.Value(start_var), solver.Value(end_var)) for name, (start_var, end_var) in task_vars.items()),
+            key=lambda x: x[1],
+        )
+        return _insert_breaks(schedule, break_duration)
+    else:
+        return "❗ Unable to fit all tasks. Try reducing durations or adding more time slots."